@@ -2,14 +2,68 @@
 import os
 import sys
 import json
-import time
+import math
+import array
+import queue
+import logging
 import threading
+import selectors
+import collections
 from typing import Optional, Dict, List
+from concurrent.futures import ThreadPoolExecutor
 
 import serial
 from serial.tools import list_ports
 
-from PySide6.QtCore import QObject, Slot, Signal
+from PySide6.QtCore import QObject, Slot, Signal, Property, QTimer
+
+# Fastest available JSON library: msgspec -> orjson -> ujson -> stdlib json.
+# All are optional. _dumps returns UTF-8 bytes; _loads accepts bytes, so RX
+# lines never need a decode step; _JSONDecodeError is what _loads raises.
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+try:
+    import orjson
+except ImportError:
+    orjson = None
+try:
+    import ujson
+except ImportError:
+    ujson = None
+
+if msgspec:
+    _dumps = msgspec.json.Encoder().encode
+    _loads = msgspec.json.Decoder().decode
+    _JSONDecodeError = (msgspec.DecodeError, ValueError)
+elif orjson:
+    _dumps = orjson.dumps
+    _loads = orjson.loads
+    _JSONDecodeError = ValueError
+elif ujson:
+    _dumps = lambda o: ujson.dumps(o).encode("utf-8")
+    _loads = ujson.loads
+    _JSONDecodeError = ValueError
+else:
+    _dumps = lambda o: json.dumps(o).encode("utf-8")
+    _loads = json.loads
+    _JSONDecodeError = ValueError
+
+# Wave command byte formats, specialized per shape at import time so the
+# constant "shape" value is already encoded. Remaining fields, in order:
+# pump, period (s), duty (%), min_flow, max_flow.
+_WAVE_FMT_TMPL = (
+    b'{"wave":{"pump":%%d,"shape":%s,"period":%%.4f,"duty":%%.2f,'
+    b'"min_flow":%%.7g,"max_flow":%%.7g}}\n'
+)
+
+
+def _wave_fmt(shape: str) -> bytes:
+    return _WAVE_FMT_TMPL % _dumps(shape).replace(b"%", b"%%")
+
+
+_WAVE_FMT: Dict[str, bytes] = {s: _wave_fmt(s) for s in ("Square", "Sinusoidal", "off")}
 
 # -------- Serial defaults (TWO ARDUINOS) --------
 # Change these COM ports to match what you see in Arduino IDE / Device Manager.
@@ -24,6 +78,53 @@ SERIAL_PORT = SERIAL_PORT_A
 
 BAUD = 115200
 OPEN_RETRY_SEC = 2.0
+# On POSIX the RX thread sleeps in select/epoll on the port's fd; Windows
+# (no selectable serial handles) uses pyserial's read timeout instead.
+RX_USE_SELECTOR = not sys.platform.startswith("win")
+RX_READ_SIZE = 4096
+
+# Slider drags can call set_flow hundreds of times a second; only the latest
+# value per pump within this window is actually sent.
+FLOW_COALESCE_MS = 20
+
+# Port status/errors are logged at INFO and above; per-command traces
+# (TX/RX traffic, QBackend slot calls) at DEBUG. Set PUMP_LOG_LEVEL=DEBUG to
+# print those too. Unknown level names fall back to INFO.
+LOG_LEVEL = logging.getLevelName(os.environ.get("PUMP_LOG_LEVEL", "INFO").upper())
+if not isinstance(LOG_LEVEL, int):
+    LOG_LEVEL = logging.INFO
+LOG_RING_SIZE = 500
+
+
+class _RingHandler(logging.Handler):
+    """Keeps the most recent formatted log lines in a bounded deque."""
+
+    def __init__(self, ring: "collections.deque[str]"):
+        super().__init__()
+        self.ring = ring
+
+    def emit(self, record: logging.LogRecord):
+        try:
+            self.ring.append(self.format(record))
+        except Exception:
+            self.handleError(record)
+
+
+_console_handler = logging.StreamHandler(sys.stdout)
+_console_handler.setFormatter(logging.Formatter("[%(name)s] %(message)s"))
+
+# recent log lines, for a console/debug view in QML
+_log_ring: "collections.deque[str]" = collections.deque(maxlen=LOG_RING_SIZE)
+_ring_handler = _RingHandler(_log_ring)
+_ring_handler.setFormatter(logging.Formatter("%(asctime)s [%(name)s] %(message)s"))
+
+log = logging.getLogger("PumpLink")
+qlog = logging.getLogger("QBackend")
+for _logger in (log, qlog):
+    _logger.setLevel(LOG_LEVEL)
+    _logger.propagate = False  # we print ourselves; don't double up if root is configured
+    _logger.addHandler(_console_handler)
+    _logger.addHandler(_ring_handler)
 
 
 class PumpLink:
@@ -32,61 +133,131 @@ class PumpLink:
     Responsible ONLY for sending JSON commands and reading back lines.
     """
 
+    # Pre-serialized command bytes, keyed by local pump ID
+    _STOP_CACHE: Dict[int, bytes] = {}
+    _PRIME_CACHE: Dict[int, bytes] = {}
+    _STOP_ALL = _dumps({"stop_all": True}) + b"\n"
+
     def __init__(self, port: str = SERIAL_PORT, baud: int = BAUD):
         self.port = port
         self.baud = baud
-        self.ser: Optional[serial.Serial] = None
-        self._stop = False
+        # Created once (unopened); open() just (re)opens this same object
+        self.ser = serial.Serial(baudrate=baud, timeout=0.1)
+        self.ser.port = port
+        # set by close(); threads wait on it instead of sleeping
+        self._stop_evt = threading.Event()
         self._rx_thread: Optional[threading.Thread] = None
-        self._tx_lock = threading.Lock()
+        self._tx_thread: Optional[threading.Thread] = None
+        # Serialized commands waiting for the writer thread
+        self._tx_q: "queue.SimpleQueue[bytes]" = queue.SimpleQueue()
 
     # ---------- Port management ----------
 
     def open(self) -> bool:
         """Open serial port, retrying until success or stop flag."""
-        if self.ser and self.ser.is_open:
+        if self.ser.is_open:
             return True
 
-        while not self._stop:
+        while not self._stop_evt.is_set():
             try:
-                print(f"[PumpLink] Opening {self.port} @ {self.baud}…")
-                self.ser = serial.Serial(self.port, self.baud, timeout=0.1)
+                log.info("Opening %s @ %s…", self.port, self.baud)
+                self.ser.open()
                 if not self._rx_thread or not self._rx_thread.is_alive():
                     self._rx_thread = threading.Thread(
                         target=self._rx_loop, daemon=True
                     )
                     self._rx_thread.start()
-                print("[PumpLink] Port open ✓")
+                if not self._tx_thread or not self._tx_thread.is_alive():
+                    self._tx_thread = threading.Thread(
+                        target=self._tx_loop, daemon=True
+                    )
+                    self._tx_thread.start()
+                self._set_low_latency()
+                log.info("Port %s open ✓", self.port)
                 return True
             except Exception as e:
-                print(f"[PumpLink] open failed on {self.port}: {e}; retrying in {OPEN_RETRY_SEC}s")
-                time.sleep(OPEN_RETRY_SEC)
+                log.warning("open failed on %s: %s; retrying in %ss", self.port, e, OPEN_RETRY_SEC)
+                self._stop_evt.wait(OPEN_RETRY_SEC)
         return False
 
+    def _set_low_latency(self):
+        """
+        Ask the driver to deliver bytes immediately (Linux ASYNC_LOW_LATENCY;
+        shrinks FTDI/USB-serial coalescing from ~16ms to ~1ms).
+        Silently ignored on platforms that do not support it.
+        """
+        try:
+            self.ser.set_low_latency_mode(True)
+        except (AttributeError, NotImplementedError, OSError, ValueError):
+            pass
+
     def close(self):
-        self._stop = True
+        self._stop_evt.set()
+        if self._tx_thread and self._tx_thread.is_alive():
+            # No timeout: the writer exits right after its current write (or
+            # within one queue poll), and we must not write concurrently.
+            self._tx_thread.join()
         try:
-            if self.ser and self.ser.is_open:
+            if self.ser.is_open:
+                # send anything still queued (e.g. a final stop_all) and let
+                # it drain before the port goes away
+                data = self._drain_tx(b"")
+                if data:
+                    self.ser.write(data)
+                self.ser.flush()
                 self.ser.close()
-                print(f"[PumpLink] Port {self.port} closed")
+                log.info("Port %s closed", self.port)
         except Exception as e:
-            print(f"[PumpLink] close error on {self.port}: {e}")
+            log.error("close error on %s: %s", self.port, e)
 
     # ---------- TX helper ----------
 
     def _send(self, obj: dict):
-        data = (json.dumps(obj) + "\n").encode("utf-8")
-        with self._tx_lock:
+        self._write_raw(_dumps(obj) + b"\n")
+
+    def _write_raw(self, data: bytes):
+        """
+        Queue an already-serialized, newline-terminated command.
+        Returns immediately; the writer thread does the actual I/O.
+        Commands issued while the port is not open are dropped (and
+        reported) rather than queued, so they can't all fire on reconnect.
+        """
+        if not self.ser.is_open:
+            log.warning("write skipped (port %s not open): %s", self.port, data)
+            return
+        self._tx_q.put(data)
+
+    # ---------- TX loop ----------
+
+    def _drain_tx(self, first: bytes) -> bytes:
+        """Return first plus everything currently queued, as one buffer."""
+        parts = [first]
+        while True:
+            try:
+                parts.append(self._tx_q.get_nowait())
+            except queue.Empty:
+                break
+        return b"".join(parts)
+
+    def _tx_loop(self):
+        while not self._stop_evt.is_set():
+            try:
+                data = self._tx_q.get(timeout=0.25)
+            except queue.Empty:
+                continue
+            # Drain whatever else is queued so a burst goes out in one write
+            data = self._drain_tx(data)
             try:
-                if not self.ser or not self.ser.is_open:
+                if not self.ser.is_open:
                     if not self.open():
-                        print(f"[PumpLink] write skipped (port {self.port} not open)")
-                        return
-                print(f"[PumpLink] TX({self.port}): {data!r}")
+                        log.warning("write skipped (port %s not open)", self.port)
+                        continue
+                log.debug("TX(%s): %s", self.port, data)
+                # No flush(): it tcdrain()s until every byte is on the wire,
+                # and the OS tty layer sends the data anyway.
                 self.ser.write(data)
-                self.ser.flush()
             except Exception as e:
-                print(f"[PumpLink] write error on {self.port}: {e}")
+                log.error("write error on %s: %s", self.port, e)
 
     # ---------- Public API used by QBackend ----------
 
@@ -95,22 +266,33 @@ class PumpLink:
         Constant flow command:
         Arduino expects: {"pump": N, "flow": F}
         """
-        self._send({"pump": int(pump), "flow": float(ul_per_min)})
+        # Hot path during ramps: format bytes directly, no dict / JSON encoder.
+        # %.7g keeps full float32 precision (what the firmware's toFloat()/atof
+        # holds) without padding, and is still valid JSON (e.g. 12.5, 1e-05).
+        self._write_raw(b'{"pump":%d,"flow":%.7g}\n' % (int(pump), float(ul_per_min)))
 
     def prime(self, pump: int):
         """
         Prime ON (continuous until explicit stop):
         Arduino expects: {"prime": N}
         """
-        self._send({"prime": int(pump)})
+        pump = int(pump)
+        data = self._PRIME_CACHE.get(pump)
+        if data is None:
+            data = self._PRIME_CACHE.setdefault(pump, _dumps({"prime": pump}) + b"\n")
+        self._write_raw(data)
 
     def stop(self, pump: int):
         """Stop a single pump."""
-        self._send({"stop": int(pump)})
+        pump = int(pump)
+        data = self._STOP_CACHE.get(pump)
+        if data is None:
+            data = self._STOP_CACHE.setdefault(pump, _dumps({"stop": pump}) + b"\n")
+        self._write_raw(data)
 
     def stop_all(self):
         """Stop all pumps."""
-        self._send({"stop_all": True})
+        self._write_raw(self._STOP_ALL)
 
     def start_wave(
         self,
@@ -151,12 +333,11 @@ class PumpLink:
         period_sec = float(period_sec) if period_sec > 0 else 1.0
 
         # Convert duty fraction (0..1) to percent (0..100) for Arduino
+        # (<= 0 -> 50%, >= 1 -> 99%)
         duty_fraction = float(duty_fraction)
-        if duty_fraction <= 0:
-            duty_fraction = 0.5
-        if duty_fraction >= 1:
-            duty_fraction = 0.99
-        duty_percent = duty_fraction * 100.0
+        duty_percent = 100.0 * (
+            duty_fraction if 0 < duty_fraction < 1 else (0.5 if duty_fraction <= 0 else 0.99)
+        )
 
         # Derive min/max if only base_flow was given
         if min_flow_ul_min is None and max_flow_ul_min is None and base_flow_ul_min is not None:
@@ -169,23 +350,15 @@ class PumpLink:
         if max_flow_ul_min is None:
             max_flow_ul_min = min_flow_ul_min
 
-        min_flow_ul_min = max(0.0, float(min_flow_ul_min))
-        max_flow_ul_min = max(0.0, float(max_flow_ul_min))
-        if max_flow_ul_min < min_flow_ul_min:
-            # swap if user accidentally inverted them
-            min_flow_ul_min, max_flow_ul_min = max_flow_ul_min, min_flow_ul_min
+        # clamp at 0, and sort in case the user accidentally inverted them
+        min_flow_ul_min, max_flow_ul_min = sorted(
+            (max(0.0, float(min_flow_ul_min)), max(0.0, float(max_flow_ul_min)))
+        )
 
-        cmd = {
-            "wave": {
-                "pump": pump,
-                "shape": shape,
-                "period": period_sec,
-                "duty": duty_percent,
-                "min_flow": min_flow_ul_min,
-                "max_flow": max_flow_ul_min,
-            }
-        }
-        self._send(cmd)
+        fmt = _WAVE_FMT.get(shape) or _wave_fmt(shape)
+        self._write_raw(
+            fmt % (pump, period_sec, duty_percent, min_flow_ul_min, max_flow_ul_min)
+        )
 
     def wave_off(self, pump: int, fallback_flow: float = 0.0):
         """
@@ -204,28 +377,80 @@ class PumpLink:
 
     # ---------- RX loop ----------
 
+    def _dispatch(self, msg):
+        """
+        Hook for decoded RX messages (e.g. {"ack": "set_flow"}).
+        Default is a no-op; QBackend can subclass or replace it.
+        """
+        pass
+
+    def _handle_line(self, line: bytes):
+        line = line.strip()
+        if not line:
+            return
+        try:
+            msg = _loads(line)
+        except _JSONDecodeError:
+            # not JSON (boot noise, partial line, ...)
+            log.debug("RX(%s, bytes): %s", self.port, line)
+            return
+        log.debug("RX(%s): %s", self.port, msg)
+        self._dispatch(msg)
+
+    def _read_polling(self) -> bytes:
+        # Block (up to the port timeout) for the first byte, then
+        # pull everything the driver has already buffered in one go.
+        chunk = self.ser.read(1)
+        if chunk:
+            n = self.ser.in_waiting
+            if n:
+                chunk += self.ser.read(n)
+        return chunk
+
     def _rx_loop(self):
-        buf = b""
-        while not self._stop:
+        buf = b""  # trailing partial line carried between reads
+        sel: Optional[selectors.BaseSelector] = None
+        sel_fd = -1
+        while not self._stop_evt.is_set():
             try:
-                chunk = self.ser.read(256) if self.ser else b""
-                if not chunk:
-                    time.sleep(0.01)
+                if not self.ser.is_open:
+                    self._stop_evt.wait(0.01)
                     continue
-                buf += chunk
-                while b"\n" in buf:
-                    line, buf = buf.split(b"\n", 1)
-                    line = line.strip()
-                    if not line:
+                if RX_USE_SELECTOR:
+                    fd = self.ser.fileno()
+                    if sel is None or fd != sel_fd:
+                        if sel:
+                            sel.close()
+                        sel = selectors.DefaultSelector()
+                        sel.register(fd, selectors.EVENT_READ)
+                        sel_fd = fd
+                    # wakes as soon as bytes arrive; timeout only to re-check _stop_evt
+                    if not sel.select(timeout=0.5):
                         continue
-                    try:
-                        txt = line.decode("utf-8", "ignore")
-                        print(f"[PumpLink] RX({self.port}, raw): {txt}")
-                    except Exception:
-                        print(f"[PumpLink] RX({self.port}, bytes): {line!r}")
+                    chunk = os.read(fd, RX_READ_SIZE)
+                    if not chunk:
+                        raise serial.SerialException("device disconnected")
+                else:
+                    chunk = self._read_polling()
+                    if not chunk:
+                        continue
+                buf += chunk
+                if b"\n" not in chunk:
+                    continue
+                # one pass over the buffer however many lines arrived;
+                # the last piece is the (possibly empty) partial line
+                parts = buf.split(b"\n")
+                buf = parts.pop()
+                for line in parts:
+                    self._handle_line(line)
             except Exception as e:
-                print(f"[PumpLink] rx error on {self.port}: {e}")
-                time.sleep(0.25)
+                log.error("rx error on %s: %s", self.port, e)
+                if sel:
+                    sel.close()
+                    sel = None
+                self._stop_evt.wait(0.25)
+        if sel:
+            sel.close()
 
 
 # ===========================================================
@@ -258,11 +483,37 @@ class QBackend(QObject):
         self.linkA = PumpLink(port=SERIAL_PORT_A, baud=BAUD)
         self.linkB = PumpLink(port=SERIAL_PORT_B, baud=BAUD)
 
-        # last constant flow commanded for each GLOBAL pump (µL/min)
-        self.last_flows: Dict[int, float] = {}
-        # saved flows for "pause selected" so we can resume
-        self.paused_flows: Dict[int, float] = {}
+        # GLOBAL pump ID -> (link, local pump ID); index 0 and unmapped IDs
+        # hold (None, None)
+        route = [(None, None)] * (max(*self.PUMP_MAP_A, *self.PUMP_MAP_B) + 1)
+        for g, l in self.PUMP_MAP_A.items():
+            route[g] = (self.linkA, l)
+        for g, l in self.PUMP_MAP_B.items():
+            route[g] = (self.linkB, l)
+        self._route_tbl = tuple(route)
+
+        # Flat per-pump arrays indexed by GLOBAL pump ID (same size as _route_tbl)
+        n = len(self._route_tbl)
+        # last constant flow commanded for each GLOBAL pump (µL/min), NaN = never set
+        self.last_flows = array.array("d", [math.nan] * n)
+        # saved flows for "pause selected" so we can resume, NaN = none saved
+        self.paused_flows = array.array("d", [math.nan] * n)
+        # set_flow values waiting for the next coalesced flush (GLOBAL IDs)
+        self._pending_flows: Dict[int, float] = {}
+        self._flush_armed = False
         self._last_error = ""
+        # for blocking per-link work that can run on both boards at once
+        self._pool = ThreadPoolExecutor(max_workers=2)
+
+    # ---------- Log view ----------
+
+    def _get_log_lines(self) -> List[str]:
+        return list(_log_ring)
+
+    # No notify signal (emitting one per TX/RX line would cost more than the
+    # logging itself): QML must poll it, e.g. from a Timer while a debug
+    # console is open.
+    logLines = Property("QVariantList", _get_log_lines)
 
     # ---------- Internal helpers ----------
 
@@ -278,16 +529,56 @@ class QBackend(QObject):
         Returns (None, None) if invalid.
         """
         p = int(pump)
-        if p in self.PUMP_MAP_A:
-            return self.linkA, self.PUMP_MAP_A[p]
-        if p in self.PUMP_MAP_B:
-            return self.linkB, self.PUMP_MAP_B[p]
+        if p >= 0:
+            try:
+                route = self._route_tbl[p]
+            except IndexError:
+                pass
+            else:
+                if route[0] is not None:
+                    return route
         self._set_error(f"Invalid pump id {p}")
         return None, None
 
+    def _route_fast(self, p: int):
+        """
+        Hot-path routing for the per-command slots: p must already be an int.
+        Valid IDs (the normal case from QML) are one table lookup; anything
+        else falls through to _route_pump, which reports the error.
+        """
+        if 0 < p < len(self._route_tbl):
+            route = self._route_tbl[p]
+            if route[0] is not None:
+                return route
+        return self._route_pump(p)
+
     def _all_links(self):
         return [self.linkA, self.linkB]
 
+    def _queue_flow(self, p: int, flow: float):
+        """Last-write-wins: remember flow for pump p and arm one flush."""
+        self._pending_flows[p] = flow
+        if not self._flush_armed:
+            self._flush_armed = True
+            QTimer.singleShot(FLOW_COALESCE_MS, self._flush_pending)
+
+    def _flush_pending(self):
+        self._flush_armed = False
+        pending, self._pending_flows = self._pending_flows, {}
+        for p, flow in pending.items():
+            link, local = self._route_tbl[p]
+            link.set_flow(local, flow)
+
+    def _drop_pending(self, p: Optional[int] = None):
+        """
+        Forget queued set_flow values (for one pump, or all) so a later
+        flush can't override a stop/prime/wave that was sent after them.
+        """
+        if p is None:
+            self._pending_flows.clear()
+        else:
+            self._pending_flows.pop(p, None)
+
     # ---------- Lifecycle ----------
 
     @Slot(result=bool)
@@ -304,8 +595,11 @@ class QBackend(QObject):
 
     @Slot()
     def close(self):
-        for link in self._all_links():
-            link.close()
+        # send any coalesced set_flow values still waiting on the timer
+        if self._pending_flows:
+            self._flush_pending()
+        # each close() may wait on its writer thread + drain; do both together
+        list(self._pool.map(lambda link: link.close(), self._all_links()))
         self.connectionChanged.emit(False)
 
     # ---------- Port discovery (optional) ----------
@@ -329,10 +623,11 @@ class QBackend(QObject):
     def prime(self, pump):
         """Prime ON: UI toggles, Arduino runs until stop()."""
         p = int(pump)
-        link, local = self._route_pump(p)
+        link, local = self._route_fast(p)
         if not link:
             return
-        print(f"[QBackend] prime(global={p} -> local={local})")
+        qlog.debug("prime(global=%s -> local=%s)", p, local)
+        self._drop_pending(p)
         link.prime(local)
 
     @Slot("QVariant")
@@ -341,10 +636,11 @@ class QBackend(QObject):
     def stop(self, pump):
         """Stop a single pump and clear any wave for it."""
         p = int(pump)
-        link, local = self._route_pump(p)
+        link, local = self._route_fast(p)
         if not link:
             return
-        print(f"[QBackend] stop(global={p} -> local={local})")
+        qlog.debug("stop(global=%s -> local=%s)", p, local)
+        self._drop_pending(p)
         link.stop(local)
         # Also ensure pulsatile is off for that pump
         link.wave_off(local, 0.0)
@@ -354,6 +650,7 @@ class QBackend(QObject):
     def stopAll(self):
         """Stop all pumps and clear all waves."""
         print("[QBackend] stopAll()")
+        self._drop_pending()
         for link in self._all_links():
             link.stop_all()
         # we intentionally keep last_flows so resume could use it if needed
@@ -373,14 +670,14 @@ class QBackend(QObject):
         """
         p = int(pump)
         f = float(ul_per_min)
-        link, local = self._route_pump(p)
+        link, local = self._route_fast(p)
         if not link:
             return
-        print(f"[QBackend] set_flow(global={p} -> local={local}, flow={f} µL/min)")
+        qlog.debug("set_flow(global=%s -> local=%s, flow=%s µL/min)", p, local, f)
         self.last_flows[p] = f
         # If there is any previous wave on this pump, Arduino code will
         # treat a new constant command as override until another wave command.
-        link.set_flow(local, f)
+        self._queue_flow(p, f)
 
     # ---------- Pause / resume for Run tab ----------
 
@@ -389,7 +686,8 @@ class QBackend(QObject):
         """Pause all by stopping them and saving flows."""
         print("[QBackend] pauseAll()")
         # Save current last_flows as paused_flows snapshot
-        self.paused_flows = dict(self.last_flows)
+        self.paused_flows[:] = self.last_flows
+        self._drop_pending()
         for link in self._all_links():
             link.stop_all()
 
@@ -407,12 +705,14 @@ class QBackend(QObject):
         ids: List[int] = [int(p) for p in pumpIds]
         print(f"[QBackend] pausePumps(global={ids})")
         for p in ids:
-            # Save flow if we have one
-            if p in self.last_flows:
-                self.paused_flows[p] = self.last_flows[p]
             link, local = self._route_pump(p)
-            if link:
-                link.stop(local)
+            if not link:
+                continue
+            # Save flow if we have one (NaN = never set, so resume falls
+            # back to whatever last_flows holds by then)
+            self.paused_flows[p] = self.last_flows[p]
+            self._drop_pending(p)
+            link.stop(local)
 
     @Slot("QVariantList")
     def resumePumps(self, pumpIds):
@@ -421,23 +721,23 @@ class QBackend(QObject):
         If we don't have a saved paused flow, fall back to last_flows.
         """
         ids: List[int] = [int(p) for p in pumpIds]
-        print(f"[QBackend] resumePumps(global={ids})")
+        qlog.debug("resumePumps(global=%s)", ids)
         for p in ids:
+            link, local = self._route_pump(p)
+            if not link:
+                continue
             # prefer paused snapshot, else last known constant flow
-            flow = self.paused_flows.get(p, self.last_flows.get(p, 0.0))
+            flow = self.paused_flows[p]
+            if math.isnan(flow):
+                flow = self.last_flows[p]
+            # clear it out from paused_flows
+            self.paused_flows[p] = math.nan
             if flow > 0:
-                link, local = self._route_pump(p)
-                if not link:
-                    continue
-                print(f"[QBackend]  -> restoring pump {p} to {flow} µL/min (local {local})")
-                link.set_flow(local, flow)
+                qlog.debug(" -> restoring pump %s to %s µL/min (local %s)", p, flow, local)
+                self._queue_flow(p, flow)
                 self.last_flows[p] = flow
             else:
-                print(f"[QBackend]  -> no saved flow for pump {p}, leaving off")
-
-        # clear them out from paused_flows
-        for p in ids:
-            self.paused_flows.pop(p, None)
+                qlog.debug(" -> no saved flow for pump %s, leaving off", p)
 
     # ---------- Automation (legacy, still supported) ----------
 
@@ -480,15 +780,15 @@ class QBackend(QObject):
             return
 
         for p in pumps:
-            base = self.last_flows.get(p, 0.0)
-            if base <= 0:
-                print(f"[QBackend]  -> pump {p} has no base flow set; skipping wave")
-                continue
-
             link, local = self._route_pump(p)
             if not link:
                 continue
 
+            base = self.last_flows[p]
+            if not base > 0:  # also catches NaN (never set)
+                print(f"[QBackend]  -> pump {p} has no base flow set; skipping wave")
+                continue
+
             print(
                 f"[QBackend]  -> starting LEGACY wave on pump {p} (local {local}): "
                 f"shape={shape}, period={period}s, dutyFraction={dutyFraction}, "
@@ -496,6 +796,7 @@ class QBackend(QObject):
             )
 
             # legacy behavior: 0 .. base
+            self._drop_pending(p)
             link.start_wave(
                 pump=local,
                 shape=shape,
@@ -538,20 +839,21 @@ class QBackend(QObject):
         minFlow = float(minFlow)
         maxFlow = float(maxFlow)
 
-        link, local = self._route_pump(p)
+        link, local = self._route_fast(p)
         if not link:
             return
 
-        print(
-            f"[QBackend] startWaveForPump(global={p} -> local={local}, shape={shape}, "
-            f"period={period_sec}s, dutyFraction={dutyFraction}, "
-            f"min={minFlow} µL/min, max={maxFlow} µL/min)"
+        qlog.debug(
+            "startWaveForPump(global=%s -> local=%s, shape=%s, period=%ss, "
+            "dutyFraction=%s, min=%s µL/min, max=%s µL/min)",
+            p, local, shape, period_sec, dutyFraction, minFlow, maxFlow,
         )
 
         # For completeness, remember the "max" as last flow hint
         if maxFlow > 0:
             self.last_flows[p] = maxFlow
 
+        self._drop_pending(p)
         link.start_wave(
             pump=local,
             shape=shape,
@@ -24,6 +24,8 @@ def main():
 
     # Open serial link to Arduino
     backend.open()
+    # Send any last queued commands and close the ports on exit
+    app.aboutToQuit.connect(backend.close)
 
     # Load the QML file
     print("Loading QML from:", QML_FILE)